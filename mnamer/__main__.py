@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 
+from threading import Thread
+
 from mnamer import tty
 from mnamer.const import IS_DEBUG
 from mnamer.exceptions import MnamerException
 from mnamer.frontends import Cli
 from mnamer.setting_store import SettingStore
+from mnamer.utils import get_session
+
+
+def _warm_session():  # pragma: no cover
+    try:
+        get_session()
+    except Exception:
+        pass  # left for the main thread's own get_session() call to report
 
 
 def main():  # pragma: no cover
@@ -12,6 +22,8 @@ def main():  # pragma: no cover
     A wrapper for the program entrypoint that formats uncaught exceptions in a
     crash report template.
     """
+    # open the request cache while arguments and config files are parsed
+    Thread(target=_warm_session, daemon=True).start()
     settings = SettingStore()
     try:
         settings.load()
@@ -22,6 +22,7 @@ __all__ = [
     "SUBTITLE_CONTAINERS",
     "SYSTEM",
     "USAGE",
+    "USER_AGENT",
     "VERSION",
     "VERSION_MAJOR",
 ]
@@ -56,4 +57,9 @@ SYSTEM = {
 
 USAGE = "USAGE: mnamer [preferences] [directives] target [targets ...]"
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, "
+    "like Gecko) Chrome/79.0.3945.88 Safari/537.36"
+)
+
 VERSION_MAJOR = int(VERSION[0])
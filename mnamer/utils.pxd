@@ -0,0 +1,14 @@
+# Static types for mnamer.utils, only used when compiled with Cython (see
+# MNAMER_ENABLE_SPEEDUPS in setup.py); the module itself stays pure Python.
+# Arguments are left untyped so e.g. None fails as it would uncompiled.
+
+cimport cython
+
+
+@cython.locals(count=Py_ssize_t)
+cpdef str_fix_padding(s)
+
+@cython.locals(
+    string_length=Py_ssize_t, pos=Py_ssize_t, start=Py_ssize_t, end=Py_ssize_t
+)
+cpdef str_title_case(s)
@@ -2,24 +2,53 @@
 
 import json
 import re
+from codecs import BOM_UTF8
+from contextlib import ExitStack
 from datetime import date, datetime
-from os import walk
+from functools import lru_cache
+from os import getcwd, scandir
 from os.path import (
-    exists,
     expanduser,
     expandvars,
     getsize,
+    isfile,
+    join,
+    normcase,
     splitdrive,
     splitext,
 )
 from pathlib import Path, PurePath
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 from unicodedata import normalize
 
 import requests_cache
+from requests import Response
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mnamer.const import (
+    CACHE_PATH,
+    CURRENT_YEAR,
+    SUBTITLE_CONTAINERS,
+    USER_AGENT,
+)
 
-from mnamer.const import CACHE_PATH, CURRENT_YEAR, SUBTITLE_CONTAINERS
+try:
+    from orjson import loads as _parse_json
+except ImportError:  # orjson is an optional, faster drop-in
+    from json import loads as _parse_json
 
 __all__ = [
     "clean_dict",
@@ -29,7 +58,6 @@ __all__ = [
     "filename_replace",
     "filter_blacklist",
     "filter_containers",
-    "findall",
     "fn_chain",
     "fn_pipe",
     "format_dict",
@@ -54,14 +82,124 @@ __all__ = [
     "year_range_parse",
 ]
 
+_FALSY_VALUES = (None, Ellipsis, [], (), "")
+_FILESIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SESSION_LOCK = Lock()
+_SUBTITLE_CONTAINERS = frozenset(c.lower() for c in SUBTITLE_CONTAINERS)
+# Each alternative only matches text it would change, so a pass that makes no
+# substitutions leaves the string untouched.
+_FIX_RE = re.compile(
+    r"(\(\s*\)|\[\s*])"  # empty brackets
+    r"|(-{2,})"  # repeating dashes
+    r"|((?:\s+[-.,_]){2,})"  # repeating delimiters
+    r"|(\s{2,}|[^\S ])"  # repeating or non-space whitespace
+)
+_WS_RE = re.compile(r"\s+")
+_ILLEGAL_RE = re.compile(r'[<>:"|?*&%=+@#`^]')
+_NONWORD_RE = re.compile(r"[^.\d\w/]")
+_DOTS_RE = re.compile(r"\.+")
+_YEAR_RE = re.compile(r"((?:19|20)\d{2})(?:$|[-/]\d{2}[-/]\d{2})")
+_YEAR_RANGE_RE = re.compile(r"^((?:19|20)\d{2})?([-,: ]*)?((?:19|20)\d{2})?$")
+_TITLE_PADDING_CHARS = ".- "
+_TITLE_PAREN_CHARS = "[](){}<>"
+_TITLE_WORD_RE = re.compile(
+    "[^"
+    + re.escape(_TITLE_PADDING_CHARS + _TITLE_PAREN_CHARS + "\"!?$,:;@_`'")
+    + "]+"
+)
+_TITLE_LOWERCASE_EXCEPTIONS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "as",
+        "at",
+        "but",
+        "by",
+        "de",
+        "des",
+        "du",
+        "for",
+        "from",
+        "in",
+        "is",
+        "le",
+        "nor",
+        "of",
+        "on",
+        "or",
+        "the",
+        "to",
+        "un",
+        "une",
+        "with",
+        "via",
+    }
+)
+_TITLE_UPPERCASE_EXCEPTIONS = frozenset(
+    {
+        "i",
+        "ii",
+        "iii",
+        "iv",
+        "v",
+        "vi",
+        "vii",
+        "viii",
+        "ix",
+        "x",
+        "2d",
+        "3d",
+        "au",
+        "aka",
+        "atm",
+        "bbc",
+        "bff",
+        "cia",
+        "csi",
+        "dc",
+        "doa",
+        "espn",
+        "fbi",
+        "ira",
+        "jfk",
+        "lol",
+        "mlb",
+        "mlk",
+        "mtv",
+        "nba",
+        "nfl",
+        "nhl",
+        "nsfw",
+        "nyc",
+        "omg",
+        "pga",
+        "oj",
+        "rsvp",
+        "tnt",
+        "tv",
+        "ufc",
+        "ufo",
+        "uk",
+        "usa",
+        "vip",
+        "wtf",
+        "wwe",
+        "wwi",
+        "wwii",
+        "xxx",
+        "yolo",
+    }
+)
+
 
 def clean_dict(target_dict: Dict[Any, Any], whitelist=None) -> Dict[Any, Any]:
     """Convenience function that removes a dicts keys that have falsy values."""
+    whitelist = frozenset(whitelist) if whitelist else None
     return {
         str(k).strip(): str(v).strip()
         for k, v in target_dict.items()
-        if v not in (None, Ellipsis, [], (), "")
-        and (not whitelist or k in whitelist)
+        if v not in _FALSY_VALUES and (whitelist is None or k in whitelist)
     }
 
 
@@ -70,36 +208,46 @@ def clear_cache():
     get_session().cache.clear()
 
 
+def _scan_dir(path: str, recurse: bool) -> Iterator[str]:
+    # mirrors os.walk: symlinked directories aren't followed, errors are ignored
+    try:
+        with scandir(path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    yield entry.path
+                elif recurse and not entry.is_symlink():
+                    yield from _scan_dir(entry.path, recurse)
+    except OSError:
+        pass
+
+
 def crawl_in(file_paths: List[Path], recurse: bool = False) -> List[Path]:
     """Looks for files amongst or within paths provided."""
-    found_files = set()
+    cwd = getcwd()
+    found_files = {}
     for file_path in file_paths:
         if not file_path.exists():
             continue
+        # normalizing here keeps paths joined below unique as plain strings
+        target = str(Path(cwd, file_path))
         if file_path.is_file():
-            found_files.add(Path(file_path).absolute())
-            continue
-        for root, _dirs, files in walk(file_path):
-            for file in files:
-                found_files.add(Path(root, file).absolute())
-            if not recurse:
-                break
-    return sorted(list(found_files))
+            paths = [target]
+        else:
+            paths = _scan_dir(target, recurse)
+        for path in paths:  # keyed by normcase as windows paths ignore case
+            found_files.setdefault(normcase(path), path)
+    return sorted(map(Path, found_files.values()))
 
 
 def crawl_out(filename: str) -> Optional[Path]:
     """Looks for a file in the home directory and each directory up from cwd."""
-    working_dir = Path.cwd()
-    while True:
-        parent_dir = working_dir.parent
-        if parent_dir == working_dir:  # e.g. fs root or error
-            break
-        target = working_dir / filename
-        if target.exists():
-            return target
-        working_dir = parent_dir
+    cwd = Path.cwd()
+    for working_dir in (cwd, *cwd.parents)[:-1]:  # i.e. excluding fs root
+        target = join(working_dir, filename)
+        if isfile(target):
+            return Path(target)
     target = Path.home() / filename
-    return target if target.exists() else None
+    return target if target.is_file() else None
 
 
 def filename_replace(filename: str, replacements: Dict[str, str]) -> str:
@@ -111,37 +259,31 @@ def filename_replace(filename: str, replacements: Dict[str, str]) -> str:
 
 def filter_blacklist(paths: List[Path], blacklist: List[str]) -> List[Path]:
     """Filters (set difference) paths by a collection of regex pattens."""
-    return [
-        path.absolute()
-        for path in paths
-        if not any(
-            re.search(pattern, str(path), re.IGNORECASE)
-            for pattern in blacklist
-            if pattern
-        )
+    patterns = [
+        re.compile(pattern, re.IGNORECASE) for pattern in blacklist if pattern
     ]
+    filtered = []
+    for path in paths:
+        path_str = str(path)
+        if not any(pattern.search(path_str) for pattern in patterns):
+            filtered.append(path.absolute())
+    return filtered
 
 
 def filter_containers(
     file_paths: List[Path], valid_containers: List[str]
 ) -> List[Path]:
     """Filters (set intersection) a collection of containers."""
-    valid_containers = normalize_containers(valid_containers)
+    valid_containers = frozenset(normalize_containers(valid_containers))
+    if not valid_containers:
+        return list(file_paths)
     return [
         file_path
         for file_path in file_paths
-        if not valid_containers or file_path.suffix.lower() in valid_containers
+        if file_path.suffix.lower() in valid_containers
     ]
 
 
-def findall(s, ss) -> Generator[int, None, None]:
-    """Yields indexes of all start positions of substring matches in string."""
-    i = s.find(ss)
-    while i != -1:
-        yield i
-        i = s.find(ss, i + 1)
-
-
 def fn_chain(*fn_list: Callable) -> Callable:
     """Chains a list of function calls into one."""
     return lambda *args, **kwargs: tuple(fn(*args, **kwargs) for fn in fn_list)
@@ -179,29 +321,51 @@ def format_iter(body: list) -> str:
 
 
 def is_subtitle(container: Optional[str]) -> bool:
-    return bool(container) and container.endswith(tuple(SUBTITLE_CONTAINERS))
+    if not container:
+        return False
+    _, dot, extension = container.rpartition(".")
+    return bool(dot) and f".{extension.lower()}" in _SUBTITLE_CONTAINERS
+
+
+def _create_session() -> requests_cache.CachedSession:
+    session = requests_cache.CachedSession(
+        cache_name=str(CACHE_PATH),
+        backend="sqlite",
+        expire_after=518_400,  # 6 days
+        fast_save=True,
+    )
+    # lets lookups read the cache while another thread is writing to it
+    with session.cache.responses.connection() as connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+    session.headers.update({"user-agent": USER_AGENT})
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    # metadata lookups hit the same few hosts; keep their sockets alive
+    adapter = HTTPAdapter(
+        pool_connections=8, pool_maxsize=32, max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def get_session() -> requests_cache.CachedSession:
     """Convenience function that returns request-cache session singleton."""
-    if not hasattr(get_session, "session"):
-        get_session.session = requests_cache.CachedSession(
-            cache_name=str(CACHE_PATH), expire_after=518_400  # 6 days
-        )
-        adapter = HTTPAdapter(max_retries=3)
-        get_session.session.mount("http://", adapter)
-        get_session.session.mount("https://", adapter)
+    with _SESSION_LOCK:  # may be first called from a warm-up thread
+        if not hasattr(get_session, "session"):
+            get_session.session = _create_session()
     return get_session.session
 
 
 def get_filesize(path: Union[PurePath, Path]) -> str:
     """Returns the human-readable filesize for a given path."""
     size = getsize(path)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024.0:
-            break
-        size /= 1024.0
-    return f"{size:.{2}f}{unit}"
+    exp = min(max(size.bit_length() - 1, 0) // 10, len(_FILESIZE_UNITS) - 1)
+    return f"{size / 1024 ** exp:.2f}{_FILESIZE_UNITS[exp]}"
 
 
 def json_dumps(d: Dict[str, Any]) -> str:
@@ -218,15 +382,16 @@ def json_dumps(d: Dict[str, Any]) -> str:
 
 
 def json_loads(path: str) -> Dict[str, Any]:
-    json_data = ""
-    path = expanduser(path)
-    path = expandvars(path)
-    if exists(path):
-        with open(path, mode="r") as fp:
-            json_data = fp.read()
-    return json.loads(json_data) if json_data else {}
+    try:
+        json_data = Path(expandvars(expanduser(path))).read_text(
+            encoding="utf-8"
+        )
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return {}
+    return _parse_json(json_data) if json_data else {}
 
 
+@lru_cache(maxsize=256)
 def normalize_container(container: str) -> str:
     """Ensures all containers begin with a dot."""
     assert container
@@ -240,17 +405,35 @@ def normalize_containers(container_list: List[str]) -> List[str]:
     return [normalize_container(container) for container in container_list]
 
 
+@lru_cache(maxsize=1024)
+def _parse_date_str(value: str) -> date:
+    value = value.replace("/", "-")
+    value = value.replace(".", "-")
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 def parse_date(value: Union[str, date, datetime]) -> date:
     """Converts an ambiguously formatted date type into a date object."""
     if isinstance(value, str):
-        value = value.replace("/", "-")
-        value = value.replace(".", "-")
-        value = datetime.strptime(value, "%Y-%m-%d")
+        return _parse_date_str(value)
     if isinstance(value, datetime):
         value = value.date()
     return value
 
 
+def _response_json(response: Response) -> Any:
+    content = response.content
+    encoding = (response.encoding or "utf-8").lower().replace("_", "-")
+    # only bare utf-8 can skip requests' encoding detection
+    if (
+        encoding in ("utf-8", "utf8")
+        and not content.startswith(BOM_UTF8)
+        and b"\x00" not in content[:4]
+    ):
+        return _parse_json(content)
+    return response.json()
+
+
 def request_json(
     url, parameters=None, body=None, headers=None, cache=True
 ) -> Tuple[int, dict]:
@@ -275,58 +458,68 @@ def request_json(
         headers["content-length"] = str(len(body))
     else:
         method = "GET"
-    headers["user-agent"] = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, "
-        "like Gecko) Chrome/79.0.3945.88 Safari/537.36"
-    )
 
-    initial_cache_state = session._is_cache_disabled  # yes, i'm a bad person
     try:
-        session._is_cache_disabled = not cache
-        response = session.request(
-            url=url,
-            params=parameters,
-            json=body,
-            headers=headers,
-            method=method,
-            timeout=1,
-        )
+        with ExitStack() as stack:
+            if not cache:
+                stack.enter_context(session.cache_disabled())
+            response = session.request(
+                url=url,
+                params=parameters,
+                json=body,
+                headers=headers,
+                method=method,
+                timeout=1,
+            )
         status = response.status_code
-        content = response.json() if status // 100 == 2 else None
+        content = _response_json(response) if status // 100 == 2 else None
     except:
         content = None
         status = 500
-    finally:
-        session._is_cache_disabled = initial_cache_state
     return status, content
 
 
+def _fix_sub(match: Match) -> str:
+    brackets, dashes, delimiters, _whitespace = match.groups()
+    if brackets:
+        return ""
+    if dashes:
+        return "-"
+    if delimiters:
+        return " " + delimiters[-1]
+    return " "
+
+
 def str_fix_padding(s: str) -> str:
     """Truncates and collapses whitespace and delimiters in strings."""
-    len_before = len(s)
-    # Remove empty brackets
-    s = re.sub(r"\(\s*\)", "", s)
-    s = re.sub(r"\[\s*]", "", s)
-    # Collapse dashes
-    s = re.sub(r"-+", "-", s)
-    # Collapse whitespace
-    s = re.sub(r"\s+", " ", s)
-    # Collapse repeating delimiters
-    s = re.sub(r"( [-.,_])+", r"\1", s)
-    # Strip leading/ trailing whitespace
-    s = s.strip()
-    # Strip leading/ trailing dashes
-    s = s.strip("-")
-    len_after = len(s)
-    return s if len_before == len_after else str_fix_padding(s)
+    while True:
+        s, count = _FIX_RE.subn(_fix_sub, s)
+        if count:
+            # strip only once settled so delimiters left behind by removing
+            # nested brackets collapse, e.g. " _[ [ ]] .b" -> ".b" not "_ .b"
+            continue
+        stripped = s.strip().strip("-")
+        if stripped == s:
+            return s
+        s = stripped
+
+
+@lru_cache(maxsize=32)
+def _replacement_pattern(words: Tuple[str, ...]) -> Pattern:
+    # one group per word so matches can be mapped back using lastindex
+    return re.compile(
+        "|".join(f"({re.escape(word)})" for word in words), re.IGNORECASE
+    )
 
 
 def str_replace(s: str, replacements: Dict[str, str]) -> str:
     """Replaces keys in replacements dict with their values."""
-    for word, replacement in replacements.items():
-        if word in s:
-            s = re.sub(re.escape(word), replacement, s, flags=re.IGNORECASE)
-    return s
+    if not replacements:
+        return s
+    words = tuple(sorted(replacements, key=len, reverse=True))
+    return _replacement_pattern(words).sub(
+        lambda match: replacements[words[match.lastindex - 1]], s
+    )
 
 
 def str_replace_slashes(s: str) -> str:
@@ -340,9 +533,9 @@ def str_sanitize(filename: str) -> str:
         base = base.rstrip(".")
         base, container_prefix = splitext(base)
         container = container_prefix + container
-    base = re.sub(r"\s+", " ", base)
+    base = _WS_RE.sub(" ", base)
     drive, tail = splitdrive(base)
-    tail = re.sub(r'[<>:"|?*&%=+@#`^]', "", tail)
+    tail = _ILLEGAL_RE.sub("", tail)
     return drive + tail.strip("-., ") + container
 
 
@@ -350,166 +543,51 @@ def str_scenify(filename: str) -> str:
     """Replaces non ascii-alphanumerics with dots."""
     filename = normalize("NFKD", filename)
     filename.encode("ascii", "ignore")
-    filename = re.sub(r"\s+", ".", filename)
-    filename = re.sub(r"[^.\d\w/]", "", filename)
-    filename = re.sub(r"\.+", ".", filename)
+    filename = _WS_RE.sub(".", filename)
+    filename = _NONWORD_RE.sub("", filename)
+    filename = _DOTS_RE.sub(".", filename)
     return filename.lower().strip(".")
 
 
 def str_title_case(s: str) -> str:
     """Attempts to intelligently apply title case transformations to strings."""
-
-    if not s:
-        return s
-
-    lowercase_exceptions = {
-        "a",
-        "an",
-        "and",
-        "as",
-        "at",
-        "but",
-        "by",
-        "de",
-        "des",
-        "du",
-        "for",
-        "from",
-        "in",
-        "is",
-        "le",
-        "nor",
-        "of",
-        "on",
-        "or",
-        "the",
-        "to",
-        "un",
-        "une",
-        "with",
-        "via",
-    }
-    uppercase_exceptions = {
-        "i",
-        "ii",
-        "iii",
-        "iv",
-        "v",
-        "vi",
-        "vii",
-        "viii",
-        "ix",
-        "x",
-        "2d",
-        "3d",
-        "au",
-        "aka",
-        "atm",
-        "bbc",
-        "bff",
-        "cia",
-        "csi",
-        "dc",
-        "doa",
-        "espn",
-        "fbi",
-        "ira",
-        "jfk",
-        "lol",
-        "mlb",
-        "mlk",
-        "mtv",
-        "nba",
-        "nfl",
-        "nhl",
-        "nsfw",
-        "nyc",
-        "omg",
-        "pga",
-        "oj",
-        "rsvp",
-        "tnt",
-        "tv",
-        "ufc",
-        "ufo",
-        "uk",
-        "usa",
-        "vip",
-        "wtf",
-        "wwe",
-        "wwi",
-        "wwii",
-        "xxx",
-        "yolo",
-    }
-    padding_chars = ".- "
-    paren_chars = "[](){}<>{}"
-    punctuation_chars = paren_chars + "\"!?$,-.:;@_`'"
-    string_lower = s.lower()
-    string_length = len(s)
-
-    # uppercase first character
     s = s.lower()
-    s = s[0].upper() + s[1:]
-
-    # uppercase characters after padding characters
-    for char in padding_chars:
-        for pos in findall(s, char):
-            if pos + 1 == string_length:
-                break
-            elif pos + 2 < string_length:
-                s = s[: pos + 1] + s[pos + 1].upper() + s[pos + 2 :]
-            else:
-                s = s[: pos + 1] + s[pos + 1].upper()
-
-    # uppercase characters inside parentheses
-    for char in paren_chars:
-        for pos in findall(s, char):
-            if pos > 0 and s[pos - 1] not in padding_chars:
-                continue
-            elif pos + 1 < string_length:
-                s = s[: pos + 1] + s[pos + 1].upper() + s[pos + 2 :]
-
-    # process lowercase transformations
-    for exception in lowercase_exceptions:
-        for pos in findall(string_lower, exception):
-            starts = pos < 2
-            if starts:
-                break
-            prev_char = string_lower[pos - 1]
-            left_partitioned = prev_char in padding_chars
-            word_length = len(exception)
-            ends = pos + word_length == string_length
-            next_char = "" if ends else string_lower[pos + word_length]
-            right_partitioned = not ends and next_char in padding_chars
-            if left_partitioned and right_partitioned:
-                s = s[:pos] + exception.lower() + s[pos + word_length :]
-
-    # process uppercase transformations
-    for exception in uppercase_exceptions:
-        for pos in findall(string_lower, exception):
-            starts = pos == 0
-            prev_char = None if starts else string_lower[pos - 1]
-            left_partitioned = (
-                starts or prev_char in padding_chars + punctuation_chars
-            )
-            word_length = len(exception)
-            ends = pos + word_length == string_length
-            next_char = "" if ends else string_lower[pos + word_length]
-            right_partitioned = (
-                ends or next_char in padding_chars + punctuation_chars
-            )
-            if left_partitioned and right_partitioned:
-                s = s[:pos] + exception.upper() + s[pos + word_length :]
-
-    return s
+    string_length = len(s)
+    parts = []
+    pos = 0
+    for match in _TITLE_WORD_RE.finditer(s):
+        start, end = match.span()
+        word = match.group()
+        prev_char = s[start - 1] if start else ""
+        # lowercase exceptions are only kept lowercase between padded words
+        keep_lowercase = (
+            word in _TITLE_LOWERCASE_EXCEPTIONS
+            and start > 1
+            and prev_char in _TITLE_PADDING_CHARS
+            and end < string_length
+            and s[end] in _TITLE_PADDING_CHARS
+        )
+        if word in _TITLE_UPPERCASE_EXCEPTIONS:
+            word = word.upper()
+        elif not keep_lowercase and (
+            not start
+            or prev_char in _TITLE_PADDING_CHARS
+            # parentheses only capitalize words they open, e.g. not 'dog(s)'
+            or prev_char in _TITLE_PAREN_CHARS
+            and (start == 1 or s[start - 2] in _TITLE_PADDING_CHARS)
+        ):
+            word = word[0].upper() + word[1:]
+        parts.append(s[pos:start])
+        parts.append(word)
+        pos = end
+    parts.append(s[pos:])
+    return "".join(parts)
 
 
 def year_parse(s: str) -> int:
     """Parses a year from a string."""
-    regex = r"((?:19|20)\d{2})(?:$|[-/]\d{2}[-/]\d{2})"
     try:
-        year = int(re.findall(regex, str(s))[0])
+        year = int(_YEAR_RE.findall(str(s))[0])
     except IndexError:
         year = None
     return year
@@ -519,11 +597,10 @@ def year_range_parse(
     years: Optional[Union[str, int]], tolerance: int = 1
 ) -> Tuple[int, int]:
     """Parses a year or dash-delimited year range."""
-    regex = r"^((?:19|20)\d{2})?([-,: ]*)?((?:19|20)\d{2})?$"
     default_start = 1900
     default_end = CURRENT_YEAR
     try:
-        start, dash, end = re.match(regex, str(years).strip()).groups()
+        start, dash, end = _YEAR_RANGE_RE.match(str(years).strip()).groups()
     except AttributeError:
         start, end, dash = None, None, True
     if not start and not end:
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from os import environ
+
 from setuptools import setup
 
 from mnamer.__version__ import VERSION
@@ -10,11 +12,35 @@ with open("readme.md", "r", encoding="utf8") as fp:
 with open("requirements.txt", "r", encoding="utf8") as fp:
     REQUIREMENTS = fp.read().splitlines()
 
+# Optionally compile string-heavy helpers with Cython; requires Cython and a C
+# compiler in the build environment, so pip's build isolation must be off, e.g.
+# `MNAMER_ENABLE_SPEEDUPS=1 pip install --no-build-isolation .`
+if environ.get("MNAMER_ENABLE_SPEEDUPS") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        raise SystemExit(
+            "MNAMER_ENABLE_SPEEDUPS=1 requires Cython to be installed in the "
+            "build environment; install it and build with "
+            "`pip install --no-build-isolation .`"
+        )
+
+    # static types come from mnamer/utils.pxd rather than the annotations
+    EXT_MODULES = cythonize(
+        "mnamer/utils.py",
+        compiler_directives={"annotation_typing": False},
+        language_level=3,
+    )
+else:
+    EXT_MODULES = []
+
 setup(
     author="Jessy Williams",
     author_email="jessy@jessywilliams.com",
     description="A media file organiser",
     entry_points={"console_scripts": ["mnamer=mnamer.__main__:main"]},
+    ext_modules=EXT_MODULES,
+    extras_require={"speedups": ["orjson"]},
     include_package_data=True,
     install_requires=REQUIREMENTS,
     license="MIT",
@@ -126,7 +126,8 @@ class E2EResult(NamedTuple):
 class MockRequestResponse:
     def __init__(self, status: int, content: str) -> None:
         self.status_code = status
-        self.content = content
+        self.content = content.encode()
+        self.encoding = None
 
     def json(self) -> Dict[str, Any]:
         from json import loads
@@ -1,11 +1,14 @@
+import os
 from pathlib import Path
+from threading import Thread
+from time import sleep
 from typing import Dict, List
 from unittest.mock import patch
 
 import pytest
-from requests import Session
+from requests import Response, Session
 
-from mnamer.const import CURRENT_YEAR, SUBTITLE_CONTAINERS
+from mnamer.const import CURRENT_YEAR, SUBTITLE_CONTAINERS, USER_AGENT
 from mnamer.types import MediaType
 from mnamer.utils import *
 from tests import *
@@ -191,6 +194,34 @@ def test_dir_crawl_in__dirs__multiple(setup_test_files):
     assert set(actual) == set(expected)
 
 
+@pytest.mark.usefixtures("setup_test_dir")
+def test_dir_crawl_in__dirs__overlapping(setup_test_files):
+    setup_test_files(*TEST_FILES.keys())
+    file_paths = [
+        Path("Downloads"),
+        Path(".", "Downloads"),
+        Path("Downloads", "the.goonies.1985.mp4"),
+    ]
+    actual = crawl_in(file_paths)
+    expected = sorted(
+        paths_for(
+            "Downloads/Return of the Jedi 1080p.mkv",
+            "Downloads/archer.2009.s10e07.webrip.x264-lucidtv.mkv",
+            "Downloads/the.goonies.1985.mp4",
+        )
+    )
+    assert actual == expected
+
+
+@patch("mnamer.utils.normcase", str.lower)  # i.e. as on windows
+@pytest.mark.usefixtures("setup_test_dir")
+def test_dir_crawl_in__dirs__overlapping_case(setup_test_files):
+    setup_test_files("Media/aladdin.1992.avi", "media/aladdin.1992.avi")
+    actual = crawl_in([Path("Media"), Path("media")])
+    expected = [Path("Media", "aladdin.1992.avi").absolute()]
+    assert actual == expected
+
+
 @pytest.mark.usefixtures("setup_test_dir")
 def test_dir_crawl_in__dirs__recurse(setup_test_files):
     setup_test_files(*TEST_FILES.keys())
@@ -207,6 +238,15 @@ def test_test_crawl_out__walking(setup_test_files):
     assert actual == expected
 
 
+@pytest.mark.usefixtures("setup_test_dir")
+def test_test_crawl_out__parent(setup_test_files):
+    setup_test_files("aladdin.2019.avi", "Downloads/the.goonies.1985.mp4")
+    expected = Path("aladdin.2019.avi").absolute()
+    os.chdir("Downloads")
+    actual = crawl_out("aladdin.2019.avi")
+    assert actual == expected
+
+
 @pytest.mark.usefixtures("setup_test_dir")
 def test_test_crawl_out__no_match():
     path = Path("/", "some_path", "avengers infinity war.wmv")
@@ -234,6 +274,20 @@ def test_str_replace__multiple_replacement():
     assert actual == expected
 
 
+def test_str_replace__case_insensitive():
+    replacements = {"THE": "a"}
+    expected = "a quick brown fox jumps over a lazy dog"
+    actual = str_replace(FILENAME_REPLACEMENT, replacements)
+    assert actual == expected
+
+
+def test_str_replace__overlapping_replacement():
+    replacements = {"o": "0", "brown fox": "red panda"}
+    expected = "The quick red panda jumps 0ver the lazy d0g"
+    actual = str_replace(FILENAME_REPLACEMENT, replacements)
+    assert actual == expected
+
+
 def test_str_replace__regex_escaping():
     expected = "hello, world!"
     actual = str_replace("hello, world?", {"?": "!"})
@@ -463,16 +517,50 @@ def test_format_iter__enum():
     assert actual == expected
 
 
+@pytest.mark.parametrize(
+    "size, expected",
+    ((0, "0.00B"), (1023, "1023.00B"), (1024, "1.00KB"), (3_670_016, "3.50MB")),
+)
+@pytest.mark.usefixtures("setup_test_dir")
+def test_get_filesize(size: int, expected: str):
+    with open(JUNK_TEXT, "wb") as fp:
+        fp.truncate(size)
+    actual = get_filesize(Path(JUNK_TEXT))
+    assert actual == expected
+
+
 @pytest.mark.parametrize("container", SUBTITLE_CONTAINERS)
 def test_is_subtitle__true(container):
     assert is_subtitle(container) is True
 
 
+@pytest.mark.parametrize("container", (".en.srt", ".SRT", "movie.idx"))
+def test_is_subtitle__true__suffix(container):
+    assert is_subtitle(container) is True
+
+
 @pytest.mark.parametrize("container", (None, "", ".abc123", "srt"))
 def test_is_subtitle__false(container):
     assert is_subtitle(container) is False
 
 
+@pytest.mark.usefixtures("setup_test_dir")
+def test_json_loads():
+    Path("config.json").write_text('{"batch": true, "hits": 5}')
+    expected = {"batch": True, "hits": 5}
+    actual = json_loads("config.json")
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "path", (JUNK_TEXT, ".", f"{JUNK_TEXT}/config.json", "notes.txt/cfg.json")
+)
+@pytest.mark.usefixtures("setup_test_dir")
+def test_json_loads__missing(path: str):
+    Path("notes.txt").touch()
+    assert json_loads(path) == {}
+
+
 def test_normalize_container__has_no_dot():
     expected = ".mkv"
     actual = normalize_container("mkv")
@@ -526,6 +614,28 @@ def test_request_json__json_data(mock_request):
     assert content == json_dict
 
 
+@pytest.mark.parametrize(
+    "data, encoding",
+    (
+        ('{"title": "Amélie"}'.encode(), None),
+        ('{"title": "Amélie"}'.encode(), "UTF-8"),
+        ('{"title": "Amélie"}'.encode("utf-8-sig"), None),
+        ('{"title": "Amélie"}'.encode("utf-16-le"), None),
+        ('{"title": "Amélie"}'.encode("latin-1"), "ISO-8859-1"),
+    ),
+)
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+def test_request_json__encoding(mock_request, data: bytes, encoding: str):
+    response = Response()
+    response.status_code = 200
+    response._content = data
+    response.encoding = encoding
+    mock_request.return_value = response
+    status, content = request_json("http://...", cache=False)
+    assert status == 200
+    assert content == {"title": "Amélie"}
+
+
 @patch("mnamer.utils.requests_cache.CachedSession.request")
 def test_request_json__xml_data(mock_request):
     xml_data = """
@@ -575,9 +685,12 @@ def test_request_json__get_headers(mock_request):
     )
     _, kwargs = mock_request.call_args
     assert kwargs["method"] == "GET"
-    assert len(kwargs["headers"]) == 2
+    assert len(kwargs["headers"]) == 1
     assert kwargs["headers"]["apple"] == "pie"
-    assert "user-agent" in kwargs["headers"]
+
+
+def test_request_json__session_user_agent():
+    assert get_session().headers["user-agent"] == USER_AGENT
 
 
 @patch("mnamer.utils.requests_cache.CachedSession.request")
@@ -627,6 +740,52 @@ def test_request_json__post_headers(mock_request):
     assert "orange" not in kwargs["headers"]
 
 
+def test_get_session__threads(monkeypatch):
+    # set first so the singleton is restored, or removed, afterwards
+    monkeypatch.setattr(get_session, "session", None, raising=False)
+    monkeypatch.delattr(get_session, "session")
+
+    def create_session():
+        sleep(0.05)  # widens the window for a second thread to race in
+        return object()
+
+    results = []
+    with patch("mnamer.utils._create_session", side_effect=create_session):
+        threads = [
+            Thread(target=lambda: results.append(get_session()))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(results) == 2
+    assert results[0] is results[1]
+
+
+def test_get_session__journal_mode():
+    session = get_session()
+    with session.cache.responses.connection() as connection:
+        (journal_mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == "wal"
+
+
+@pytest.mark.parametrize("cache", (True, False))
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+def test_request_json__cache(mock_request, cache: bool):
+    session = get_session()
+    cache_states = []
+
+    def request(**_):
+        cache_states.append(session._is_cache_disabled)
+        return MockRequestResponse(200, "{}")
+
+    mock_request.side_effect = request
+    request_json("http://...", cache=cache)
+    assert cache_states == [not cache]
+    assert session._is_cache_disabled is False
+
+
 @patch("mnamer.utils.requests_cache.CachedSession.request")
 def test_request_json__failure(mock_request):
     mock_request.side_effect = Exception
@@ -663,6 +822,22 @@ def test_str_fix_padding__collapse_delimiters(s: str):
     assert actual == expected
 
 
+@pytest.mark.parametrize(
+    "s, expected",
+    (
+        ("s ( ) - t", "s - t"),
+        ("s -[] - t", "s - t"),
+        ("s\t-\t- t", "s - t"),
+        # edges are stripped only after nested brackets have been removed
+        (" _[ [ ]( )] .b", ".b"),
+        ("\xa0 _( ( ))[ ] ---b", "b"),
+    ),
+)
+def test_str_fix_padding__collapse_mixed(s: str, expected: str):
+    actual = str_fix_padding(s)
+    assert actual == expected
+
+
 def test_str_fix_padding__empty():
     expected = ""
     actual = str_fix_padding("")
@@ -697,6 +872,15 @@ def test_str_title_case__lower__only_whole_words(s: str):
     assert actual == expected
 
 
+@pytest.mark.parametrize(
+    "s", ("the lord of the rings", "THE LORD OF THE RINGS")
+)
+def test_str_title_case__lower__repeated(s: str):
+    expected = "The Lord of the Rings"
+    actual = str_title_case(s)
+    assert actual == expected
+
+
 @pytest.mark.parametrize("s", ("world war ii", "WORLD WAR II"))
 def test_str_title_case__upper(s: str):
     expected = "World War II"
@@ -806,6 +990,13 @@ def test_str_title_case__single_char():
     assert actual == expected
 
 
+@pytest.mark.parametrize("fn", (str_fix_padding, str_sanitize, str_title_case))
+def test_str_helpers__none(fn):
+    fn("x")  # compiled builds must not reuse state from a prior call
+    with pytest.raises((AttributeError, TypeError)):
+        fn(None)
+
+
 def test_year_parse__valid():
     expected = 1987
     actual = year_parse("1987")